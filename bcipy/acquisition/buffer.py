@@ -40,7 +40,8 @@ class Buffer():
         assert archive_name, "An empty archive name will result in " \
             "an in-memory database that cannot be shared across processes."
 
-        # Flush to data store when buf is this size.
+        # Flush to data store when buf is this size. Records are held in the
+        # format used for insertion: (timestamp, *channel data).
         self._chunksize = chunksize
         self._archive_name = archive_name
         self._buf = deque()
@@ -111,7 +112,27 @@ class Buffer():
         if self.start_time is None:
             self.start_time = record.timestamp
 
-        self._buf.append(record)
+        self._buf.append(_adapt_record(record))
+
+        if len(self._buf) >= self._chunksize:
+            self._flush()
+
+    def append_rows(self, rows):
+        """Append rows of data which are already in the storage format,
+        avoiding the conversion from Records.
+
+        Parameters
+        ----------
+            rows: list of sequences
+                each row is the timestamp followed by the data for each
+                channel.
+        """
+        if not rows:
+            return
+        if self.start_time is None:
+            self.start_time = rows[0][0]
+
+        self._buf.extend(rows)
 
         if len(self._buf) >= self._chunksize:
             self._flush()
@@ -119,13 +140,11 @@ class Buffer():
     def _flush(self):
         """Writes data to the datastore and empties the buffer."""
 
-        data = [_adapt_record(self._buf.popleft())
-                for i in range(len(self._buf))]
-
-        if data:
+        if self._buf:
             # Performs writes in a single transaction;
             with self._conn as conn:
-                conn.executemany(self._insert_stmt, data)
+                conn.executemany(self._insert_stmt, self._buf)
+            self._buf.clear()
 
     def __len__(self):
         self._flush()
@@ -1,10 +1,13 @@
 """Module for creating server (Process) that manages a data buffer."""
 import logging
 import multiprocessing as mp
+import queue
 from bcipy.acquisition.buffer import Buffer
+from bcipy.acquisition.shared_buffer import SharedRingBuffer
 
 # Commands to which the server can respond.
 MSG_PUT = 'put_data'
+MSG_PUT_MANY = 'put_many'
 MSG_GET_ALL = 'get_all_data'
 MSG_QUERY_SLICE = 'query_slice'
 MSG_QUERY = 'query_data'
@@ -13,10 +16,14 @@ MSG_EXIT = 'exit'
 MSG_STARTED = 'started'
 MSG_DUMP_RAW_DATA = 'dump_data'
 
+# Time (in seconds) between checks for new data when records are written
+# through a SharedRingBuffer.
+RING_POLL_INTERVAL = 0.01
+
 log = logging.getLogger(__name__)
 
 
-def _loop(msg_queue, response_queue, channels, archive_name):
+def _loop(msg_queue, response_queue, channels, archive_name, ring=None):
     """Main server loop. Intended to be a Process target (and private to this
     module). Accepts messages through its mailbox queue, and takes the
     appropriate action based on the command and parameters contained within the
@@ -34,13 +41,27 @@ def _loop(msg_queue, response_queue, channels, archive_name):
             channel.
         archive_name : str
             sqlite database name
+        ring : SharedRingBuffer, optional
+            shared memory buffer through which records are appended. If
+            provided, it is drained periodically and before every command.
     """
     buf = Buffer(channels=channels, archive_name=archive_name)
+    timeout = RING_POLL_INTERVAL if ring is not None else None
 
     while True:
         # Messages should be tuples with the structure:
         # (command, params)
-        msg = msg_queue.get()
+        try:
+            msg = msg_queue.get(timeout=timeout)
+        except queue.Empty:
+            msg = None
+
+        if ring is not None:
+            # Rows are stored in the same layout used by the Buffer.
+            buf.append_rows(ring.drain_rows())
+
+        if msg is None:
+            continue
         command, params = msg
         if command == MSG_EXIT:
             buf.cleanup(delete_archive=params)
@@ -49,6 +70,11 @@ def _loop(msg_queue, response_queue, channels, archive_name):
         elif command == MSG_PUT:
             # params is the record to put
             buf.append(params)
+        elif command == MSG_PUT_MANY:
+            # params is a list of records; these are written to the data
+            # store in a single transaction when the buffer is flushed.
+            for record in params:
+                buf.append(record)
         elif command == MSG_GET_ALL:
             response_queue.put(buf.all())
         elif command == MSG_COUNT:
@@ -70,17 +96,33 @@ def _loop(msg_queue, response_queue, channels, archive_name):
             log.debug("Error; message not understood: %s", msg)
 
 
-def new_mailbox():
+def new_mailbox(channel_count=None, ring_capacity=None):
     """Creates a new mailbox used to communicate with a buffer process, but
     does not create or start the process.
 
+    Parameters
+    ----------
+        channel_count : int, optional
+            number of channels in each record; required if ring_capacity is
+            provided.
+        ring_capacity : int, optional
+            if provided, records are appended through a SharedRingBuffer of
+            this size rather than sent as messages. Record data must be
+            numeric.
     Returns
     -------
-        Tuple of Queues used to communicate with this server instance.
+        Tuple of (message Queue, response Queue, SharedRingBuffer or None)
+        used to communicate with this server instance.
     """
     msg_queue = mp.Queue()
     response_queue = mp.Queue()
-    return (msg_queue, response_queue)
+    ring = None
+    if ring_capacity:
+        if not channel_count:
+            raise ValueError("channel_count is required when a ring_capacity "
+                             "is provided.")
+        ring = SharedRingBuffer(ring_capacity, channel_count)
+    return (msg_queue, response_queue, ring)
 
 
 def start_server(mailbox, channels, archive_name):
@@ -88,7 +130,8 @@ def start_server(mailbox, channels, archive_name):
 
     Parameters
     ----------
-        mailbox: tuple of Queues used to communicate with this server instance.
+        mailbox: tuple used to communicate with this server instance; see
+            new_mailbox.
         channels : list of str
             list of channel names. Data records are expected to have an entry
             for each channel.
@@ -96,17 +139,17 @@ def start_server(mailbox, channels, archive_name):
             underlying database name
     """
     log.debug("Starting the database server")
-    msg_queue, response_queue = mailbox
+    msg_queue, response_queue, ring = mailbox
     server_process = mp.Process(target=_loop,
                                 args=(msg_queue, response_queue, channels,
-                                      archive_name))
+                                      archive_name, ring))
     server_process.start()
 
     request = (MSG_STARTED, None)
     return _rpc(mailbox, request, wait_reply=True)
 
 
-def start(channels, archive_name, asynchronous=False):
+def start(channels, archive_name, asynchronous=False, ring_capacity=None):
     """Starts a server Process.
 
     Parameters
@@ -119,15 +162,17 @@ def start(channels, archive_name, asynchronous=False):
         asynchronous : boolean, optional; default False
             if true, returns immediately; otherwise waits for a response
             from the newly started server.
+        ring_capacity : int, optional
+            if provided, records are appended through a SharedRingBuffer of
+            this size rather than sent as messages.
     Returns
     -------
-        Tuple of Queues used to communicate with this server instance.
+        Tuple used to communicate with this server instance; see new_mailbox.
     """
-    msg_queue = mp.Queue()
-    response_queue = mp.Queue()
-    mailbox = (msg_queue, response_queue)
+    mailbox = new_mailbox(len(channels), ring_capacity)
+    msg_queue, response_queue, ring = mailbox
     server_process = mp.Process(target=_loop, args=(
-        msg_queue, response_queue, channels, archive_name))
+        msg_queue, response_queue, channels, archive_name, ring))
     server_process.start()
     if not asynchronous:
         request = (MSG_STARTED, None)
@@ -166,7 +211,7 @@ def _rpc(mailbox, request, wait_reply=True):
     -------
         Response from the server or None.
     """
-    msg_queue, response_queue = mailbox
+    msg_queue, response_queue, _ring = mailbox
     if wait_reply:
         msg_queue.put(request)
         # block until we receive something
@@ -178,20 +223,61 @@ def _rpc(mailbox, request, wait_reply=True):
 
 
 def append(mailbox, record):
-    """Write the record to the given buffer process. Returns immediately and
-     does not wait for a response.
+    """Write the record to the given buffer process. Does not wait for a
+    response.
+
+    If the mailbox has a SharedRingBuffer, the record is written to it
+    rather than sent as a message; this blocks while the ring is full.
+    Otherwise the record is sent as a message and this returns immediately.
 
     Parameters
     ----------
-        mailbox : Queue
-            process queue
+        mailbox : tuple
+            (message Queue, response Queue, SharedRingBuffer or None); see
+            new_mailbox.
         record : Record
             data row to write.
+    Raises
+    ------
+        TimeoutError if the ring is still full after its timeout.
     """
+    ring = mailbox[2]
+    if ring is not None:
+        ring.put(record)
+        return
     request = (MSG_PUT, record)
     _rpc(mailbox, request, wait_reply=False)
 
 
+def append_many(mailbox, records):
+    """Write a batch of records to the given buffer process. Does not wait
+    for a response.
+
+    If the mailbox has a SharedRingBuffer, the records are written to it
+    rather than sent as a message; this blocks while the ring is full.
+    Otherwise the batch is sent as a single message and this returns
+    immediately.
+
+    Parameters
+    ----------
+        mailbox : tuple
+            (message Queue, response Queue, SharedRingBuffer or None); see
+            new_mailbox.
+        records : list of Record
+            data rows to write.
+    Raises
+    ------
+        TimeoutError if the ring is still full after its timeout.
+    """
+    ring = mailbox[2]
+    if ring is not None:
+        for record in records:
+            ring.put(record)
+        return
+    request = (MSG_PUT_MANY, list(records))
+    _rpc(mailbox, request, wait_reply=False)
+
+
 def count(mailbox):
     """Get the count of the total number of entries in the buffer.
 
@@ -269,8 +355,8 @@ def dump_data(mailbox, raw_data_file_name: str, daq_type: str,
 
 def main():
     """Test script"""
-    import numpy as np
     from bcipy.acquisition.record import Record
+    from bcipy.acquisition.util import mock_data
     import timeit
 
     n_rows = 1000
@@ -281,8 +367,7 @@ def main():
     pid2 = start(channels, 'buffer2.db')
 
     starttime = timeit.default_timer()
-    for i in range(n_rows):
-        data = [np.random.uniform(-1000, 1000) for _ in range(channel_count)]
+    for i, data in enumerate(mock_data(n_rows, channel_count)):
         if i % 2 == 0:
             append(pid1, Record(data, i, None))
         else:
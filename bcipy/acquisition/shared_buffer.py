@@ -0,0 +1,129 @@
+"""Defines a fixed-size ring buffer backed by shared memory, used to pass
+data records from a producer process to the buffer server process without
+pickling and messaging each record individually."""
+import multiprocessing as mp
+import time
+
+import numpy as np
+from bcipy.acquisition.record import Record
+
+# Time (in seconds) the producer sleeps while waiting for the consumer to
+# free up space in a full buffer.
+FULL_WAIT_INTERVAL = 0.001
+# Default max time (in seconds) the producer waits for space in a full buffer
+# before assuming that the consumer has stopped.
+FULL_TIMEOUT = 10.0
+
+
+class SharedRingBuffer():
+    """Single-producer, single-consumer queue of fixed-width numeric records
+    stored in shared memory.
+
+    Each slot holds the record timestamp followed by the channel data, so
+    only records with numeric data are supported. Record rownums are not
+    stored. The buffer must be passed to the consumer process on creation
+    (ex. as an argument to the Process constructor).
+
+    Parameters
+    ----------
+        capacity: int
+            max number of records held before the consumer must read them;
+            when full, the producer waits.
+        channel_count: int
+            number of data values in each record.
+        timeout: float, optional
+            max seconds to wait for space when the buffer is full.
+    """
+
+    def __init__(self, capacity: int, channel_count: int,
+                 timeout: float = FULL_TIMEOUT):
+        assert capacity > 0, "Capacity must be greater than 0."
+        assert channel_count > 0, "Channel count must be greater than 0."
+
+        self.capacity = capacity
+        self.width = channel_count + 1
+        self.timeout = timeout
+        self._data = mp.RawArray('d', capacity * self.width)
+
+        # Total number of records written and read. Reads and writes of these
+        # values are synchronized, so a slot is fully written before it is
+        # visible to the consumer and fully read before it can be reused.
+        self._head = mp.Value('Q', 0)
+        self._tail = mp.Value('Q', 0)
+
+        # numpy view of the shared data; created on demand in each process.
+        self._rows = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_rows'] = None
+        return state
+
+    def __len__(self):
+        return self._head.value - self._tail.value
+
+    @property
+    def rows(self):
+        """2-d numpy view (capacity x width) of the shared data."""
+        if self._rows is None:
+            self._rows = np.frombuffer(self._data, dtype=np.float64).reshape(
+                self.capacity, self.width)
+        return self._rows
+
+    def put(self, record: Record):
+        """Write a record to the next free slot. Blocks while the buffer is
+        full.
+
+        Parameters
+        ----------
+            record: Record
+                record with numeric data for each channel.
+        Raises
+        ------
+            TimeoutError if the buffer is still full after the timeout,
+            ex. because the consumer has stopped reading.
+        """
+        head = self._head.value
+        if head - self._tail.value >= self.capacity:
+            deadline = time.monotonic() + self.timeout
+            while head - self._tail.value >= self.capacity:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        "SharedRingBuffer is full; the consumer has not read "
+                        f"any data in {self.timeout} seconds.")
+                time.sleep(FULL_WAIT_INTERVAL)
+
+        row = self.rows[head % self.capacity]
+        row[0] = record.timestamp
+        row[1:] = record.data
+        self._head.value = head + 1
+
+    def drain_rows(self):
+        """Read all rows written since the last call and free up their
+        slots.
+
+        Returns
+        -------
+            list of rows (timestamp followed by the channel data) in the
+            order in which they were written.
+        """
+        tail = self._tail.value
+        head = self._head.value
+        if head == tail:
+            return []
+
+        slots = np.arange(tail, head) % self.capacity
+        rows = self.rows[slots].tolist()
+        self._tail.value = head
+        return rows
+
+    def drain(self):
+        """Read all records written since the last call and free up their
+        slots.
+
+        Returns
+        -------
+            list of Records in the order in which they were written.
+        """
+        return [Record(data=row[1:], timestamp=row[0], rownum=None)
+                for row in self.drain_rows()]
@@ -125,6 +125,24 @@ class TestBuffer(unittest.TestCase):
 
         buf.cleanup()
 
+    def test_append_rows(self):
+        """Rows in the storage format should be queryable as Records."""
+        n_records = 1000
+        channel_count = 25
+        channels = ["ch" + str(c) for c in range(channel_count)]
+
+        buf = Buffer(channels=channels, chunksize=300)
+
+        data = list(mock_data(n_records, channel_count))
+        buf.append_rows([[float(i)] + row for i, row in enumerate(data)])
+
+        self.assertEqual(buf.start_time, 0.0)
+        self.assertEqual(len(buf), n_records)
+        rows = buf.query(start=10.0, end=20.0, field='timestamp')
+        self.assertEqual([r.data for r in rows], data[10:20])
+        self.assertEqual(rows[0].timestamp, 10.0)
+        buf.cleanup()
+
     def test_query_data(self):
         """Test querying for data."""
         n_records = 20
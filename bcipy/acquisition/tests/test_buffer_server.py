@@ -1,5 +1,6 @@
 """Tests for the buffer_server module"""
 import unittest
+import numpy as np
 from bcipy.acquisition import buffer_server
 from bcipy.acquisition.record import Record
 from bcipy.acquisition.util import mock_data
@@ -31,9 +32,11 @@ class TestBufferServer(unittest.TestCase):
     def test_count(self):
         """Test that the count of records is correct."""
         n_records = 500
-        for i, data in enumerate(mock_data(n_records, self.channel_count)):
-            buffer_server.append(self.pid, Record(data=data, timestamp=i,
-                                                  rownum=None))
+        buffer_server.append_many(
+            self.pid,
+            [Record(data=data, timestamp=i, rownum=None)
+             for i, data in enumerate(mock_data(n_records,
+                                                self.channel_count))])
 
         self.assertEqual(buffer_server.count(self.pid), n_records)
 
@@ -41,17 +44,19 @@ class TestBufferServer(unittest.TestCase):
         """Test querying for a slice of data."""
 
         data = list(mock_data(n_records=150, n_cols=self.channel_count))
-        for i, record in enumerate(data):
-            buffer_server.append(self.pid, Record(data=record, timestamp=i,
-                                                  rownum=None))
+        buffer_server.append_many(
+            self.pid,
+            [Record(data=record, timestamp=i, rownum=None)
+             for i, record in enumerate(data)])
 
         start = 10
         end = 20
 
         result = buffer_server.get_data(
             self.pid, start, end, field='timestamp')
-        self.assertEqual([r.data for r in result], data[start:end], "Should \
-            return the slice of data requested.")
+        np.testing.assert_array_equal(
+            np.array([r.data for r in result]), np.array(data[start:end]),
+            "Should return the slice of data requested.")
 
     def test_query_data(self):
         """Test query_data method"""
@@ -77,25 +82,28 @@ class TestBufferServer(unittest.TestCase):
         """Test method to get all data from buffer."""
 
         data = list(mock_data(n_records=150, n_cols=self.channel_count))
-        for record_index, record in enumerate(data):
-            buffer_server.append(self.pid, Record(data=record,
-                                                  timestamp=record_index,
-                                                  rownum=None))
+        buffer_server.append_many(
+            self.pid,
+            [Record(data=record, timestamp=record_index, rownum=None)
+             for record_index, record in enumerate(data)])
 
         result = buffer_server.get_data(self.pid)
-        self.assertEqual([r.data for r in result], data, "Should return all \
-            data")
+        np.testing.assert_array_equal(
+            np.array([r.data for r in result]), np.array(data),
+            "Should return all data")
 
     def test_multiple_servers(self):
         """Test multiple concurrent servers."""
         pid2 = buffer_server.start(self.channels, self._next_buf_name())
 
         n_records = 200
-        for count, data in enumerate(mock_data(n_records, self.channel_count)):
-            if count % 2 == 0:
-                buffer_server.append(self.pid, Record(data, count, None))
-            else:
-                buffer_server.append(pid2, Record(data, count, None))
+        data = list(mock_data(n_records, self.channel_count))
+        # even records go to the first server; odd records to the second.
+        buffer_server.append_many(
+            self.pid, [Record(data[i], i, None)
+                       for i in range(0, n_records, 2)])
+        buffer_server.append_many(
+            pid2, [Record(data[i], i, None) for i in range(1, n_records, 2)])
 
         self.assertEqual(buffer_server.count(self.pid), n_records / 2)
         self.assertEqual(buffer_server.count(pid2), n_records / 2)
@@ -105,3 +113,21 @@ class TestBufferServer(unittest.TestCase):
 
         self.assertNotEqual(server1_data, server2_data)
         buffer_server.stop(pid2)
+
+
+class TestBufferServerSharedRing(TestBufferServer):
+    """Runs the buffer_server tests with records appended through a
+    SharedRingBuffer. Capacity is less than the number of records written by
+    most tests so the buffer wraps around."""
+
+    def setUp(self):
+        """Run before each test."""
+        self.channel_count = 25
+        self.channels = ["ch" + str(c) for c in range(self.channel_count)]
+        self.pid = buffer_server.start(self.channels, self._next_buf_name(),
+                                       ring_capacity=64)
+
+    def test_ring_requires_channel_count(self):
+        """A mailbox with a ring should require the channel count."""
+        with self.assertRaises(ValueError):
+            buffer_server.new_mailbox(ring_capacity=64)
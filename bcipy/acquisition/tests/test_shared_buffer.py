@@ -0,0 +1,54 @@
+"""Tests for the SharedRingBuffer"""
+import unittest
+from bcipy.acquisition.record import Record
+from bcipy.acquisition.shared_buffer import SharedRingBuffer
+from bcipy.acquisition.util import mock_data
+
+
+class TestSharedRingBuffer(unittest.TestCase):
+    """Tests for the SharedRingBuffer"""
+
+    def test_put_and_drain(self):
+        """Records should be read in the order in which they were written."""
+        channel_count = 5
+        buf = SharedRingBuffer(capacity=10, channel_count=channel_count)
+        data = list(mock_data(n_records=4, n_cols=channel_count))
+        for i, row in enumerate(data):
+            buf.put(Record(data=row, timestamp=float(i), rownum=None))
+
+        self.assertEqual(len(buf), 4)
+        records = buf.drain()
+        self.assertEqual([r.data for r in records], data)
+        self.assertEqual([r.timestamp for r in records], [0.0, 1.0, 2.0, 3.0])
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(buf.drain(), [])
+
+    def test_wrap_around(self):
+        """Slots should be reused once they have been read."""
+        channel_count = 3
+        buf = SharedRingBuffer(capacity=4, channel_count=channel_count)
+        data = list(mock_data(n_records=10, n_cols=channel_count))
+
+        result = []
+        for i, row in enumerate(data):
+            buf.put(Record(data=row, timestamp=float(i), rownum=None))
+            if len(buf) == 3:
+                result.extend(buf.drain())
+        result.extend(buf.drain())
+
+        self.assertEqual([r.data for r in result], data)
+        self.assertEqual([r.timestamp for r in result],
+                         [float(i) for i in range(10)])
+
+    def test_put_when_full(self):
+        """Writing to a full buffer should fail if no consumer reads it."""
+        channel_count = 3
+        buf = SharedRingBuffer(capacity=2, channel_count=channel_count,
+                               timeout=0.05)
+        for i, row in enumerate(mock_data(n_records=2, n_cols=channel_count)):
+            buf.put(Record(data=row, timestamp=float(i), rownum=None))
+
+        with self.assertRaises(TimeoutError):
+            buf.put(Record(data=[0.0] * channel_count, timestamp=2.0,
+                           rownum=None))
+        self.assertEqual(len(buf), 2)
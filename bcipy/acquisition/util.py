@@ -19,7 +19,9 @@ def mock_data(n_records: int, n_cols: int, low: int = -1000, high: int = 1000):
     --------
         A generator that yields arrays of random data
     """
-    return (mock_record(n_cols, low, high) for _i in range(n_records))
+    # Draw all of the values in a single call rather than one per item.
+    values = np.random.uniform(low, high, size=(n_records, n_cols))
+    return (row.tolist() for row in values)
 
 # def mock_data_stream(n_records: int, length: int, low: int= -1000,
 #     high: int = 1000):
@@ -52,7 +54,7 @@ def mock_record(n_cols: int = 25, low: int = -1000, high: int = 1000):
     --------
         list of random values
     """
-    return [np.random.uniform(low, high) for _cc in range(n_cols)]
+    return np.random.uniform(low, high, size=n_cols).tolist()
 
 
 class StoppableProcess(multiprocessing.Process):
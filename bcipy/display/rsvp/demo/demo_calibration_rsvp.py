@@ -32,16 +32,17 @@ if is_txt_stim:
         ['E', '+', 'F', 'G', 'E', '-', 'S', 'Q', 'W', 'E', '<', 'A', 'Z'],
         ['W', '+', 'F', 'G', 'E', '-', 'S', 'Q', 'W', 'E', '<', 'A', 'Z'],
         ['Q', '+', 'F', 'G', 'E', '-', 'S', 'Q', 'W', 'E', '<', 'A', 'Z']]
-    color_sti = [['green', 'red', 'white', 'white', 'white', 'white', 'white',
-                  'white', 'white', 'white', 'white', 'white', 'white']] * 4
+    # one independent list per sequence
+    color_sti = [['green', 'red'] + ['white'] * 11 for _ in ele_sti]
 
 
 time_flash = .25
 time_target = 2
 time_cross = .6
 
-timing_sti = [[time_target] + [time_cross] + [time_flash] *
-              (len(ele_sti[0]) - 1)] * 4
+timing_sti_row = [time_target] + [time_cross] + [time_flash] * \
+    (len(ele_sti[0]) - 1)
+timing_sti = [list(timing_sti_row) for _ in ele_sti]
 
 task_text = ['1/100', '2/100', '3/100', '4/100']
 task_color = [['white'], ['white'], ['white'], ['white']]
@@ -85,6 +86,7 @@ rsvp = CalibrationDisplay(
     stim_colors=['white'] * 10,
     stim_timing=[3] * 10,
     is_txt_stim=is_txt_stim)
+rsvp.sti.height = sti_height
 
 # uncomment trigger_file lines for demo with triggers!
 # trigger_file = open('calibration_triggers.txt','w')
@@ -93,17 +95,17 @@ for idx_o in range(len(task_text)):
     rsvp.update_task_state(text=task_text[idx_o], color_list=task_color[idx_o])
     rsvp.draw_static()
     win.flip()
-    rsvp.sti.height = sti_height
 
-    # Schedule a sequence
+    # Schedule a sequence during the inter-sequence interval
+    clock.start(.4)
     rsvp.stimuli_sequence = ele_sti[idx_o]
 
     if is_txt_stim:
         rsvp.stimuli_colors = color_sti[idx_o]
 
     rsvp.stimuli_timing = timing_sti[idx_o]
+    clock.complete()
 
-    core.wait(.4)
     sequence_timing = rsvp.do_sequence()
 
     # _write_triggers_from_sequence_calibration(sequence_timing, trigger_file)
@@ -33,14 +33,15 @@ if is_txt_stim:
         ['+', 'F', 'G', 'E', '-', 'S', 'Q', 'W', 'E', '<', 'A', 'Z'],
         ['+', 'F', 'G', 'E', '-', 'S', 'Q', 'W', 'R', '<', 'A', 'Z'],
         ['+', 'F', 'G', 'E', '-', 'S', 'Q', 'W', 'E', '<', 'A', 'R']]
-    color_sti = [['red', 'white', 'white', 'white', 'white', 'white',
-                  'white', 'white', 'white', 'white', 'white', 'white']] * 4
+    # one independent list per sequence
+    color_sti = [['red'] + ['white'] * 11 for _ in ele_sti]
 
 time_flash = .25
 time_target = 2
 time_cross = .6
 
-timing_sti = [[time_cross] + [time_flash] * (len(ele_sti[0]) - 1)] * 4
+timing_sti_row = [time_cross] + [time_flash] * (len(ele_sti[0]) - 1)
+timing_sti = [list(timing_sti_row) for _ in ele_sti]
 
 
 task_text = ['COPY_PHA', 'COPY_PH']
@@ -85,6 +86,7 @@ rsvp = CopyPhraseDisplay(
     stim_sequence=['a'] * 10, stim_colors=['white'] * 10,
     stim_timing=[3] * 10,
     is_txt_stim=is_txt_stim)
+rsvp.sti.height = sti_height
 
 counter = 0
 
@@ -95,18 +97,17 @@ for idx_o in range(len(task_text)):
     rsvp.update_task_state(text=task_text[idx_o], color_list=task_color[idx_o])
     rsvp.draw_static()
     win.flip()
-    rsvp.sti.height = sti_height
 
     for idx in range(int(len(ele_sti) / 2)):
-        # Schedule a sequence
+        # Schedule a sequence during the inter-sequence interval
+        clock.start(.4)
         rsvp.stimuli_sequence = ele_sti[counter]
         if is_txt_stim:
             rsvp.stimuli_colors = color_sti[counter]
 
         rsvp.stimuli_timing = timing_sti[counter]
+        clock.complete()
 
-        #
-        core.wait(.4)
         sequence_timing = rsvp.do_sequence()
 
         # _write_triggers_from_sequence_copy_phrase(sequence_timing,
@@ -116,6 +116,10 @@ class RSVPDisplay(object):
         self.first_stim_callback = lambda _sti: None
         self.size_list_sti = []
 
+        # Image stimuli keyed by (image path, height); images are only loaded
+        # from disk the first time they are presented.
+        self._image_stimuli = {}
+
         self.space_char = space_char
 
         self.task = visual.TextStim(win=self.window, color=task_color[0],
@@ -275,10 +279,8 @@ class RSVPDisplay(object):
 
             # Set the Stimuli attrs
             if self.stimuli_sequence[idx].endswith('.png'):
-                current_stim['sti'] = self.create_stimulus(mode='image', height_int=this_stimuli_size)
-                current_stim['sti'].image = self.stimuli_sequence[idx]
-                current_stim['sti'].size = resize_image(
-                    current_stim['sti'].image, current_stim['sti'].win.size, this_stimuli_size)
+                current_stim['sti'] = self._image_stimulus(
+                    self.stimuli_sequence[idx], this_stimuli_size)
                 current_stim['sti_label'] = path.splitext(
                     path.basename(self.stimuli_sequence[idx]))[0]
             else:
@@ -311,6 +313,21 @@ class RSVPDisplay(object):
             stim_info.append(current_stim)
         return stim_info
 
+    def _image_stimulus(self, image_path: str,
+                        height: float) -> visual.ImageStim:
+        """Image Stimulus.
+
+        Returns an ImageStim for the given image, sized for the given height.
+        Stimuli are cached and reused in later sequences.
+        """
+        key = (image_path, height)
+        if key not in self._image_stimuli:
+            stimulus = self.create_stimulus(mode='image', height_int=height)
+            stimulus.image = image_path
+            stimulus.size = resize_image(image_path, stimulus.win.size, height)
+            self._image_stimuli[key] = stimulus
+        return self._image_stimuli[key]
+
     def update_task_state(self, text: str, color_list: List[str]) -> None:
         """Update task state.
 
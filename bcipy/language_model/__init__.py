@@ -1,3 +0,0 @@
-import sys
-from os.path import dirname
-sys.path.append(dirname(__file__))
@@ -1,6 +1,5 @@
 import numpy as np
 from random import shuffle, randint
-import math
 from bcipy.helpers.task import alphabet
 
 
@@ -36,10 +35,9 @@ def eegs(path):
             num_sym = 0
             a_sample = np.array(a_sample)
             # assuming it's log likelihood and not negative ll
-            transformed_dist = [math.e**(prob) for prob in a_sample]
-            total = sum(transformed_dist)
-            normalized_dist = [(prob / total) for prob in transformed_dist]
-            eeg_dict[sample] = [-math.log(prob) for prob in normalized_dist]
+            transformed_dist = np.exp(a_sample)
+            normalized_dist = transformed_dist / transformed_dist.sum()
+            eeg_dict[sample] = (-np.log(normalized_dist)).tolist()
             sample += 1
             a_sample = []
     return eeg_dict
@@ -1,7 +1,5 @@
-from eeg_utils import simulate_eeg
+from bcipy.language_model.demo.eeg_utils import simulate_eeg
 from bcipy.language_model.oclm_language_model import LangModel
-import sys
-sys.path.append('.')
 
 
 def main():
@@ -1,7 +1,5 @@
 from bcipy.helpers.language_model import norm_domain
 from bcipy.language_model.prelm_language_model import LangModel
-import sys
-sys.path.append('.')
 
 
 def main():
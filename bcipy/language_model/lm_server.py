@@ -8,6 +8,10 @@ import requests
 from bcipy.language_model.errors import DockerDownError, ConnectionErr, \
     StatusCodeError
 log = logging.getLogger(__name__)
+
+# HTTP sessions keyed by (host, port). Reusing a session keeps the connection
+# to the server alive between requests.
+_SESSIONS = {}
 # pylint: disable=too-few-public-methods,too-many-arguments
 
 
@@ -53,9 +57,27 @@ def running_containers(client, server_config: LmServerConfig) -> List:
     return client.containers.list(filters={"ancestor": server_config.image})
 
 
+def session(server_config: LmServerConfig) -> requests.Session:
+    """Returns the HTTP session used to communicate with the server with the
+    given config, creating it if needed."""
+    key = (server_config.host, server_config.port)
+    if key not in _SESSIONS:
+        _SESSIONS[key] = requests.Session()
+    return _SESSIONS[key]
+
+
+def close_session(server_config: LmServerConfig):
+    """Closes the HTTP session for the given config, if any."""
+    open_session = _SESSIONS.pop((server_config.host, server_config.port),
+                                 None)
+    if open_session:
+        open_session.close()
+
+
 def stop(server_config: LmServerConfig):
     """Stop the given docker image if it is currently running.
     """
+    close_session(server_config)
     try:
         client = docker.from_env()
     except BaseException:
@@ -134,7 +156,7 @@ def post_json_request(server_config: LmServerConfig,
     port = server_config.port
     url = f'http://{host}:{port}/{path}'
     try:
-        response = requests.post(url, json=data)
+        response = session(server_config).post(url, json=data)
     except requests.ConnectionError:
         raise ConnectionErr(host, port)
     if not response.status_code == requests.codes.ok:
@@ -1,7 +1,6 @@
 import logging
-import sys
 from typing import List
-from collections import defaultdict
+from collections import OrderedDict
 from bcipy.helpers.task import alphabet, SPACE_CHAR
 from bcipy.language_model import lm_server
 from bcipy.language_model.errors import (EvidenceDataStructError,
@@ -9,9 +8,16 @@ from bcipy.language_model.errors import (EvidenceDataStructError,
                                          NBestHighValue)
 from bcipy.language_model.lm_server import LmServerConfig
 log = logging.getLogger(__name__)
-sys.path.append('.')
-ALPHABET = alphabet()
+ALPHABET = tuple(alphabet())
 LM_SPACE = '#'
+# Alphabet symbol => symbol used by the language model server.
+LM_SYMBOLS = {symbol: LM_SPACE if symbol == SPACE_CHAR else symbol.lower()
+              for symbol in ALPHABET}
+# Language model server symbol => alphabet symbol.
+ALPHABET_SYMBOLS = {lm_symbol: symbol
+                    for symbol, lm_symbol in LM_SYMBOLS.items()}
+# Max number of state_update results kept by a LangModel.
+PRIORS_CACHE_SIZE = 256
 
 
 class LangModel:
@@ -32,7 +38,15 @@ class LangModel:
           logfile - a valid filename to function as a logger
         """
         self.server_config = server_config
-        self.priors = defaultdict(list)
+        self.priors = {}
+
+        # Priors for previously seen evidence histories, keyed by
+        # (history since the last reset, return_mode).
+        self._cache = OrderedDict()
+        # Evidence provided since the last reset, and how much of it has been
+        # sent to the server. Updates are only sent on cache misses.
+        self._history = []
+        self._server_history_len = 0
 
         log.setLevel(logging.INFO)
         log.addHandler(logging.FileHandler(logfile))
@@ -51,6 +65,9 @@ class LangModel:
             raise NBestHighValue(nbest)
         lm_server.post_json_request(
             self.server_config, 'init', data={'nbest': nbest})
+        self._cache.clear()
+        self._history = []
+        self._server_history_len = 0
 
     def cleanup(self):
         """Stop the docker server"""
@@ -61,7 +78,11 @@ class LangModel:
         Clean observations of the language model use reset
         """
         lm_server.post_json_request(self.server_config, 'reset')
-        self.priors = defaultdict(list)
+        self.priors = {}
+        # Cached priors are keyed on the full history since reset, so they
+        # remain valid.
+        self._history = []
+        self._server_history_len = 0
         log.info("\ncleaning history\n")
 
     def state_update(self, evidence: List, return_mode: str = 'letter'):
@@ -82,27 +103,57 @@ class LangModel:
                      in the Negative Log probabilty domain.
         """
 
-        # assert the input contains a valid symbol
+        # convert to server symbols; a KeyError indicates an invalid symbol.
+        lm_symbols = LM_SYMBOLS
         try:
-            clean_evidence = []
-            for tmp_evidence in evidence:
-                tmp = []
-                for (symbol, pr) in tmp_evidence:
-                    assert symbol in ALPHABET, \
-                        "%r contains invalid symbol" % evidence
-                    if symbol == SPACE_CHAR:
-                        tmp.append((LM_SPACE, pr))
-                    else:
-                        tmp.append((symbol.lower(), pr))
-                clean_evidence.append(tmp)
+            clean_evidence = [[(lm_symbols[symbol], pr)
+                               for (symbol, pr) in tmp_evidence]
+                              for tmp_evidence in evidence]
         except BaseException:
             raise EvidenceDataStructError
 
-        output = lm_server.post_json_request(self.server_config,
-                                             'state_update',
-                                             {'evidence': clean_evidence,
-                                              'return_mode': return_mode})
-        return self.__return_priors(output, return_mode)
+        # The history is only updated once the priors have been retrieved,
+        # so a failed request can be retried.
+        history = self._history + clean_evidence
+        key = (tuple(map(tuple, history)), return_mode)
+        if key in self._cache:
+            self._history = history
+            return self.__cached_priors(key)
+
+        output = self.__update_server(history, return_mode)
+        self._history = history
+        priors = self.__return_priors(output, return_mode)
+        self.__cache_priors(key, priors)
+        return priors
+
+    def __cached_priors(self, key):
+        """
+        Set the current priors from the cache entry for the given key.
+        """
+        self._cache.move_to_end(key)
+        self.priors = self._cache[key]
+        return self.priors
+
+    def __cache_priors(self, key, priors):
+        """
+        Add the priors to the cache, evicting the least recently used entry
+        if full.
+        """
+        self._cache[key] = priors
+        if len(self._cache) > PRIORS_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def __update_server(self, history, return_mode):
+        """
+        Send the evidence in the given history which the server has not yet
+        seen (due to cache hits) as a single multi-timestep update.
+        """
+        output = lm_server.post_json_request(
+            self.server_config, 'state_update',
+            {'evidence': history[self._server_history_len:],
+             'return_mode': return_mode})
+        self._server_history_len = len(history)
+        return output
 
     def _logger(self):
         """
@@ -121,11 +172,22 @@ class LangModel:
         Display the priors given the recent decision
         """
 
-        if not bool(self.priors[return_mode]):
-            output = lm_server.post_json_request(self.server_config,
-                                                 'recent_priors',
-                                                 {'return_mode': return_mode})
-            return self.__return_priors(output, return_mode)
+        if not bool(self.priors.get(return_mode)):
+            # Priors for the current history may have been cached by an
+            # earlier call with this return_mode.
+            key = (tuple(map(tuple, self._history)), return_mode)
+            if key in self._cache:
+                return self.__cached_priors(key)
+
+            if self._server_history_len < len(self._history):
+                output = self.__update_server(self._history, return_mode)
+            else:
+                output = lm_server.post_json_request(
+                    self.server_config, 'recent_priors',
+                    {'return_mode': return_mode})
+            priors = self.__return_priors(output, return_mode)
+            self.__cache_priors(key, priors)
+            return priors
         else:
             return self.priors
 
@@ -135,13 +197,14 @@ class LangModel:
         depending on the return_mode
         """
 
-        self.priors = defaultdict(list)
-        self.priors['letter'] = [
-            (letter.upper(), prob)
-            if letter != LM_SPACE
-            else (SPACE_CHAR, prob)
-            for (letter, prob) in output['letter']]
+        # A new dict is created for each response since previous results are
+        # cached by state_update.
+        to_alphabet = ALPHABET_SYMBOLS.get
+        priors = {'letter': [
+            (to_alphabet(letter) or letter.upper(), prob)
+            for (letter, prob) in output['letter']]}
 
         if return_mode != 'letter':
-            self.priors[return_mode] = list(map(tuple, output[return_mode]))
-        return self.priors
+            priors[return_mode] = list(map(tuple, output[return_mode]))
+        self.priors = priors
+        return priors
@@ -1,5 +1,4 @@
 import logging
-import sys
 from typing import List
 from collections import defaultdict
 from bcipy.helpers.task import alphabet, SPACE_CHAR
@@ -7,7 +6,6 @@ from bcipy.language_model import lm_server
 from bcipy.language_model.lm_server import LmServerConfig
 from bcipy.helpers.system_utils import dot
 log = logging.getLogger(__name__)
-sys.path.append('.')
 ALPHABET = alphabet()
 LM_SPACE = '#'
 
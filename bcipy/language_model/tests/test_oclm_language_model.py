@@ -0,0 +1,134 @@
+"""Tests for the oclm LangModel which do not require the docker server."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from mock import patch
+
+from bcipy.language_model import lm_server
+from bcipy.language_model.errors import ConnectionErr
+from bcipy.language_model.oclm_language_model import LangModel, log
+
+RESPONSE = {'letter': [('a', 1.0), ('#', 2.0)], 'word': [['ab', 1.0]]}
+
+
+class TestOclmLangModel(unittest.TestCase):
+    """Tests for the oclm LangModel priors caching."""
+
+    def setUp(self):
+        """Run before each test."""
+        self.requests = []
+        self.fail_next = False
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+        start = patch.object(lm_server, 'start')
+        post = patch.object(lm_server, 'post_json_request',
+                            side_effect=self._post)
+        start.start()
+        post.start()
+        self.addCleanup(patch.stopall)
+
+        handlers = list(log.handlers)
+        self.lmodel = LangModel(logfile=os.path.join(self.tmp_dir, 'lm.log'))
+        for handler in log.handlers:
+            if handler not in handlers:
+                self.addCleanup(handler.close)
+                self.addCleanup(log.removeHandler, handler)
+        self.lmodel.init(nbest=2)
+        self.requests.clear()
+
+    def _post(self, _config, path, data=None):
+        """Mock server request which records the path and data."""
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionErr('127.0.0.1', 6000)
+        self.requests.append((path, data))
+        return RESPONSE
+
+    def test_state_update(self):
+        """Evidence should be converted to server symbols."""
+        priors = self.lmodel.state_update([[('A', 0.8), ('_', 0.2)]])
+        self.assertEqual(priors, {'letter': [('A', 1.0), ('_', 2.0)]})
+        self.assertEqual(self.requests, [
+            ('state_update', {'evidence': [[('a', 0.8), ('#', 0.2)]],
+                              'return_mode': 'letter'})])
+
+    def test_reset_keeps_cache(self):
+        """Cached priors should be used after a reset without a request."""
+        priors = self.lmodel.state_update([[('A', 0.8)]])
+        self.lmodel.reset()
+        self.requests.clear()
+
+        self.assertEqual(self.lmodel.state_update([[('A', 0.8)]]), priors)
+        self.assertEqual(self.requests, [])
+
+    def test_skipped_evidence_sent_on_miss(self):
+        """Evidence skipped by a cache hit should be sent with the next
+        update as a single request."""
+        self.lmodel.state_update([[('A', 0.8)]])
+        self.lmodel.reset()
+        self.lmodel.state_update([[('A', 0.8)]])
+        self.requests.clear()
+
+        self.lmodel.state_update([[('B', 0.5)]])
+        self.assertEqual(self.requests, [
+            ('state_update', {'evidence': [[('a', 0.8)], [('b', 0.5)]],
+                              'return_mode': 'letter'})])
+
+    def test_init_clears_cache(self):
+        """Cached priors should not be used after init."""
+        self.lmodel.state_update([[('A', 0.8)]])
+        self.lmodel.init(nbest=1)
+        self.requests.clear()
+
+        self.lmodel.state_update([[('A', 0.8)]])
+        self.assertEqual(self.requests, [
+            ('state_update', {'evidence': [[('a', 0.8)]],
+                              'return_mode': 'letter'})])
+
+    def test_failed_update_retry(self):
+        """A failed update should not change the history, so a retry sends
+        the evidence only once."""
+        self.fail_next = True
+        with self.assertRaises(ConnectionErr):
+            self.lmodel.state_update([[('A', 0.1)]])
+
+        self.lmodel.state_update([[('A', 0.1)]])
+        self.assertEqual(self.requests, [
+            ('state_update', {'evidence': [[('a', 0.1)]],
+                              'return_mode': 'letter'})])
+
+    def test_recent_priors_sends_skipped_evidence(self):
+        """recent_priors should send evidence skipped by a cache hit rather
+        than asking for the priors of an outdated server history."""
+        self.lmodel.state_update([[('A', 0.8)]])
+        self.lmodel.reset()
+        self.lmodel.state_update([[('A', 0.8)]])
+        self.requests.clear()
+
+        priors = self.lmodel.recent_priors('word')
+        self.assertEqual(priors['word'], [('ab', 1.0)])
+        self.assertEqual(self.requests, [
+            ('state_update', {'evidence': [[('a', 0.8)]],
+                              'return_mode': 'word'})])
+
+    def test_recent_priors_cached(self):
+        """recent_priors for another return_mode should be served from the
+        cache once they have been retrieved for the same history."""
+        self.lmodel.state_update([[('A', 0.8)]])
+        priors = self.lmodel.recent_priors('word')
+        self.assertEqual(self.requests[-1],
+                         ('recent_priors', {'return_mode': 'word'}))
+
+        self.lmodel.reset()
+        self.lmodel.state_update([[('A', 0.8)]])
+        self.requests.clear()
+
+        self.assertEqual(self.lmodel.recent_priors('word'), priors)
+        self.assertEqual(self.requests, [])
+
+
+if __name__ == '__main__':
+    unittest.main()